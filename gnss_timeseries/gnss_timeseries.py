@@ -1,3 +1,4 @@
+from functools import lru_cache
 import numpy as np
 from timeseries.timeseries import LayeredTimeSeries
 from .aux import (sec_min, sec_hour, sec_day, sec_month, sec_year,
@@ -16,16 +17,28 @@ _dict_nan_pgd = dict(PGD=np.nan, t_PGD=np.nan)
 
 def parse_time(t_str):
     if isinstance(t_str, str):
-        return float(t_str[:-1])*_dict_time_in_sec[t_str[-1]]
+        return _parse_time_str(t_str)
     return t_str
 
 
 def parse_frequency(t_freq):
     if isinstance(t_freq, str):
-        return float(t_freq[:-2])/_dict_time_in_sec[t_freq[-1]]
+        return _parse_frequency_str(t_freq)
     return t_freq
 
 
+# only strings are cached: other values are returned as they are (they may
+# be unhashable, and 1, 1.0 and True would share an entry)
+@lru_cache(maxsize=256)
+def _parse_time_str(t_str):
+    return float(t_str[:-1])*_dict_time_in_sec[t_str[-1]]
+
+
+@lru_cache(maxsize=256)
+def _parse_frequency_str(t_freq):
+    return float(t_freq[:-2])/_dict_time_in_sec[t_freq[-1]]
+
+
 class GnssTimeSeries(LayeredTimeSeries):
     """
     This class implements a ring-buffer to store GNSS coordinates of a station,
@@ -55,6 +68,8 @@ class GnssTimeSeries(LayeredTimeSeries):
         :type sampling_rate: str or float
         :type window_offset: str or float
         """
+        # function called (without arguments) when the data is modified
+        self._on_update = None
         layers_dict = {'coords': _coord_labels,
                        'std_coords': _std_coord_labels}
         super(GnssTimeSeries, self).__init__(
@@ -72,6 +87,40 @@ class GnssTimeSeries(LayeredTimeSeries):
     def set_window_offset(self, window_offset):
         self.win_offset = parse_time(window_offset)
 
+    def set_on_update(self, func):
+        """Sets a function to be called (without arguments) every time the
+        data is modified through :py:func:`add_point`, :py:func:`set_series`
+        or :py:func:`clear`.
+
+        :param func: function (None to remove it)
+        """
+        self._on_update = func
+
+    def _notify_update(self):
+        # (the attribute may be missing in an unpickled buffer)
+        on_update = getattr(self, '_on_update', None)
+        if on_update is not None:
+            on_update()
+
+    def add_point(self, *args, **kwargs):
+        out = super().add_point(*args, **kwargs)
+        self._notify_update()
+        return out
+
+    def set_series(self, *args, **kwargs):
+        out = super().set_series(*args, **kwargs)
+        self._notify_update()
+        return out
+
+    def __getstate__(self):
+        # the function set with set_on_update is not pickled (it is usually
+        # bound to the object holding this buffer)
+        getstate = getattr(super(), '__getstate__', None)
+        state = self.__dict__ if getstate is None else getstate()
+        if isinstance(state, dict) and '_on_update' in state:
+            state = dict(state, _on_update=None)
+        return state
+
     def ref_values(self):
         return (tuple(self._enu_ref[c] for c in _coord_labels),
                 self._win_ref_values, self._t_origin)
@@ -289,6 +338,7 @@ class GnssTimeSeries(LayeredTimeSeries):
     def clear(self):
         self._clear_ref_values()
         super().clear()
+        self._notify_update()
 
 
 def index_eval_factory(t):
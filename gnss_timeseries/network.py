@@ -1,12 +1,19 @@
-from collections import Iterable
-from math import sqrt, isfinite
+from functools import partial
+from itertools import compress, repeat
+import math
 import numpy as np
-from geoproj.proj import TransverseMercator
 from gnss_timeseries.gnss_timeseries import (GnssTimeSeries, parse_time,
                                              parse_frequency)
 from gnss_timeseries.aux import default_win_ref, default_win_pgd
+from gnss_timeseries.projection import has_numba, tm_forward
+if has_numba:
+    from numba import njit
 # maximum distance (km) to the hipocenter for Mw estimation using PGD
 default_max_distance = 800.
+# initial size of the arrays with one element per station
+_initial_capacity = 64
+# scale of the differences (lon, lat, depth) between two hypocenters
+_hypocenter_scale = np.array((1., 1., 0.01))
 
 
 class NetworkTimeSeries:
@@ -17,20 +24,35 @@ class NetworkTimeSeries:
     :ivar _station_ts: list of instances of
         :py:class:`gnss_timeseries.gnss_timeseries.GnssTimeSeriesSimple`
     """
+    # floating point type of the projected coordinates and the horizontal
+    # distances (reference coordinates and times are always float64)
+    _dtype = np.float32
+    __slots__ = ('n_sta', '_station_ts', '_codes', '_code2index', '_names',
+                 '_ref_lon', '_ref_lat', '_t_first', '_t_oldest', '_t_last',
+                 'window_offset', 'ts_length', 's_rate', '_kwargs_other',
+                 '_lat_range', '_lon_range', '_lon_ref',
+                 '_hypocenter', '_t_origin', '_distance_dict',
+                 '_log10_distance_dict', '_max_distance', '_epicenter',
+                 '_dist_hor_2')
 
     def __init__(self, length='1h', sampling_rate='1/s',
                  window_offset='7m', **kwargs_other):
         self.n_sta = 0
         self._station_ts = []
-        self._ref_coords = []
         self._codes = []
         self._code2index = dict()
         self._names = []
+        # reference longitude and latitude of each station
+        self._ref_lon = np.full(_initial_capacity, np.nan)
+        self._ref_lat = np.full(_initial_capacity, np.nan)
+        # available window of each station: first, oldest and last times
+        self._t_first = np.full(_initial_capacity, np.nan)
+        self._t_oldest = np.full(_initial_capacity, np.nan)
+        self._t_last = np.full(_initial_capacity, np.nan)
         self.window_offset = parse_time(window_offset)
         self.ts_length = parse_time(length)
         self.s_rate = parse_frequency(sampling_rate)
         self._kwargs_other = kwargs_other
-        self._tm = TransverseMercator(0., 0.)
         self._lat_range = np.array([100., -100.])
         self._lon_range = np.array([370., -200.])
         self._lon_ref = np.nan
@@ -38,23 +60,44 @@ class NetworkTimeSeries:
         self._hypocenter = np.full(3, np.nan)  # lon, lat, depth
         self._t_origin = np.nan  # origin time (UTC timestamp)
         self._distance_dict = dict()
+        # log10 of the distances in self._distance_dict
+        self._log10_distance_dict = dict()
         self._max_distance = np.nan
+        # squared horizontal distances (km^2) of the stations to the epicenter
+        # self._epicenter (the first self._dist_hor_2.size stations)
+        self._epicenter = np.full(2, np.nan)
+        self._dist_hor_2 = np.empty(0, dtype=self._dtype)
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__
+                if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        # the buffers are pickled without their update functions
+        for index, ts in enumerate(self._station_ts):
+            ts.set_on_update(partial(self._update_window, index))
 
     def available_window(self):
+        """Time window covered by the buffers of the network. It is updated
+        every time a buffer is modified.
+
+        :return: first time, oldest time and last time
+        """
         if self.n_sta == 0:
             return np.nan, np.nan, np.nan
-        t_min = np.inf
-        t_max = -np.inf
-        t_oldest = np.inf
-        for index in range(self.n_sta):
-            ts = self._station_ts[index]
-            if ts.t_first < t_min:
-                t_min = ts.t_first
-            if ts.t_last > t_max:
-                t_max = ts.t_last
-            if ts.t_oldest < t_oldest:
-                t_oldest = ts.t_oldest
-        return t_min, t_oldest, t_max
+        n = self.n_sta
+        # fmin/fmax ignore NaN values (stations without data)
+        return (np.fmin.reduce(self._t_first[:n], initial=np.inf),
+                np.fmin.reduce(self._t_oldest[:n], initial=np.inf),
+                np.fmax.reduce(self._t_last[:n], initial=-np.inf))
+
+    def _update_window(self, index):
+        ts = self._station_ts[index]
+        self._t_first[index] = ts.t_first
+        self._t_oldest[index] = ts.t_oldest
+        self._t_last[index] = ts.t_last
 
     def available_window_contains(self, t):
         t_min, t_oldest, t_max = self.available_window()
@@ -85,26 +128,35 @@ class NetworkTimeSeries:
             print('  *** {:s}:  no ref coords.'.format(code))
             print('\n'*2)
             return
+        if self.n_sta == self._ref_lon.size:
+            self._grow_station_arrays()
         self._code2index[code] = self.n_sta
         self.n_sta += 1
         self._codes.append(code)
         self._names.append(name)
-        self._ref_coords.append(
-            (np.nan, np.nan) if ref_coords is None else ref_coords)
-        self._station_ts.append(GnssTimeSeries(
-            length=self.ts_length, sampling_rate=self.s_rate,
-            window_offset=self.window_offset))
-        if ref_coords is not None:
-            lat = ref_coords[1]
-            if lat < self._lat_range[0]:
-                self._lat_range[0] = lat
-            elif lat > self._lat_range[1]:
-                self._lat_range[1] = lat
-            lon = ref_coords[0]
-            if lon < self._lon_range[0]:
-                self._lon_range[0] = lon
-            elif lon > self._lon_range[1]:
-                self._lon_range[1] = lon
+        self._ref_lon[self.n_sta - 1] = ref_coords[0]
+        self._ref_lat[self.n_sta - 1] = ref_coords[1]
+        ts = GnssTimeSeries(length=self.ts_length, sampling_rate=self.s_rate,
+                            window_offset=self.window_offset)
+        self._station_ts.append(ts)
+        # keeps the available window up to date, also when the buffer is
+        # modified directly (see station_timeseries)
+        ts.set_on_update(partial(self._update_window, self.n_sta - 1))
+        self._update_window(self.n_sta - 1)
+        lon, lat = ref_coords[:2]
+        self._lat_range[0] = min(self._lat_range[0], lat)
+        self._lat_range[1] = max(self._lat_range[1], lat)
+        self._lon_range[0] = min(self._lon_range[0], lon)
+        self._lon_range[1] = max(self._lon_range[1], lon)
+
+    def _grow_station_arrays(self):
+        """Doubles the size of the arrays with one element per station"""
+        aux = np.full(self._ref_lon.size, np.nan)
+        self._ref_lon = np.concatenate((self._ref_lon, aux))
+        self._ref_lat = np.concatenate((self._ref_lat, aux))
+        self._t_first = np.concatenate((self._t_first, aux))
+        self._t_oldest = np.concatenate((self._t_oldest, aux))
+        self._t_last = np.concatenate((self._t_last, aux))
 
     def lat_range(self):
         return self._lat_range
@@ -127,7 +179,7 @@ class NetworkTimeSeries:
         return self.station_timeseries(sta_code).cleared
 
     def station_is_available(self, sta_code):
-        return sta_code in self._codes
+        return sta_code in self._code2index
 
     def get_coords(self, sta, get_time=True, layers=None, as_dict=False):
         return self.station_timeseries(sta).get(
@@ -164,42 +216,40 @@ class NetworkTimeSeries:
                                check_sampling_rate=False):
         sta_timeseries = self.station_timeseries(sta)
         if check_sampling_rate:
-            beta = np.median(t[1:] - t[:-1])*sta_timeseries.s_rate
+            beta = np.median(np.diff(t))*sta_timeseries.s_rate
             if abs(beta - 1.0) < 1.e-8:
                 coords_aux = coords
                 std_coords_aux = std_coords
             else:
-                n = t.size
                 m = int(round(beta))
-                n_aux = (n-1)*m + 1
-                coords_aux = []
-                std_coords_aux = []
-                for k in range(3):
-                    x = np.full(n_aux, np.nan)
-                    x[::m] = coords[k]
-                    coords_aux.append(x)
-                    s = np.full(n_aux, np.nan)
-                    s[::m] = std_coords[k]
-                    std_coords_aux.append(s)
+                n_aux = (t.size-1)*m + 1
+                # rows: E, N, U
+                coords_aux = np.full((3, n_aux), np.nan)
+                coords_aux[:, ::m] = coords
+                std_coords_aux = np.full((3, n_aux), np.nan)
+                std_coords_aux[:, ::m] = std_coords
         else:
             coords_aux = coords
             std_coords_aux = std_coords
 
-        self.station_timeseries(sta).set_series(
+        sta_timeseries.set_series(
             {'coords': coords_aux, 'std_coords': std_coords_aux}, t[-1])
 
     def ref_coords(self, code=None):
         """Reference coordinates of a station
 
-        :param code: station index or code
+        :param code: station code or a list of them (all stations if None)
         :return: longitude, latitude
         """
         if code is None:
-            return self._ref_coords
+            return list(zip(self._ref_lon[:self.n_sta].tolist(),
+                            self._ref_lat[:self.n_sta].tolist()))
         elif isinstance(code, str):
-            return self._ref_coords[self._sta2index(code)]
+            index = self._sta2index(code)
+            return self._ref_lon[index], self._ref_lat[index]
         else:
-            return tuple(self._ref_coords[self._sta2index(c)] for c in code)
+            return tuple((self._ref_lon[index], self._ref_lat[index])
+                         for index in map(self._sta2index, code))
 
     def dist_to_hypocenter(self, code=None):
         if code is None:
@@ -222,21 +272,17 @@ class NetworkTimeSeries:
         return self.station_timeseries(sta_code).ref_values_are_set()
 
     def ref_coord_vectors(self, stations=None):
+        """Reference coordinates of a set of stations as arrays
+
+        :param stations: station codes (all stations if None)
+        :return: (longitudes, latitudes), station codes
+        """
         if stations is None:
-            n_sta = self.n_sta
-            stations = self._codes
-        else:
-            n_sta = len(stations)
-        lon = np.zeros(n_sta)
-        lat = np.zeros(n_sta)
-        if stations is None:
-            for k, x in enumerate(self._ref_coords):
-                lon[k], lat[k] = x
-        else:
-            for k, code in enumerate(stations):
-                index = self._code2index[code]
-                lon[k], lat[k] = self._ref_coords[index]
-        return (lon, lat), stations
+            return ((self._ref_lon[:self.n_sta], self._ref_lat[:self.n_sta]),
+                    self._codes)
+        index = np.fromiter((self._code2index[code] for code in stations),
+                            dtype=np.intp, count=len(stations))
+        return (self._ref_lon[index], self._ref_lat[index]), stations
 
     def station_codes(self):
         return self._codes
@@ -251,9 +297,12 @@ class NetworkTimeSeries:
         return self._code2index[code]
 
     def _sta2index(self, code):
-        if isinstance(code, int):
+        index = self._code2index.get(code)
+        if index is not None:
+            return index
+        if isinstance(code, (int, np.integer)):
             return code
-        return self._code2index[code]
+        raise KeyError(code)
 
     def get_indices(self, codes):
         return [self._code2index[code] for code in codes]
@@ -263,26 +312,45 @@ class NetworkTimeSeries:
             self._t_origin = t_origin
 
     def set_hypocenter_coords(self, coords, max_distance=None):
-        if coords is None or not np.any(np.isnan(self._hypocenter)) and max(
-                abs(coords[0] - self._hypocenter[0]),
-                abs(coords[1] - self._hypocenter[1]),
-                0.01*abs(coords[2] - self._hypocenter[2])) < 1.e-5:
+        if coords is None:
+            return
+        coords = np.array(coords, dtype=float)
+        delta = np.abs((coords - self._hypocenter)*_hypocenter_scale)
+        # (a NaN difference, i.e., no previous hypocenter, is not small)
+        if np.max(delta) < 1.e-5:
             return
         if max_distance is None:
             max_distance = default_max_distance
         self._max_distance = max_distance
         self._hypocenter = coords
-        self._tm.reset(coords[0], coords[1])
-        depth_2 = coords[2]*coords[2]
-        for code, ref_coords in zip(self._codes, self._ref_coords):
-            if ref_coords is None:
-                continue
-            x, y = self._tm(*ref_coords)
-            r = sqrt(depth_2 + (x*x + y*y)*1.e-6)
-            if r < max_distance:
-                self._distance_dict[code] = r
-            else:
-                self._distance_dict.pop(code, None)
+        # the projection is skipped if only the depth has changed
+        if not np.array_equal(coords[:2], self._epicenter):
+            self._epicenter = coords[:2]
+            self._dist_hor_2 = np.empty(0, dtype=self._dtype)
+        n_done = self._dist_hor_2.size
+        if n_done < self.n_sta:
+            self._dist_hor_2 = np.concatenate((
+                self._dist_hor_2, self._eval_dist_hor_2(n_done)))
+        r = np.sqrt(coords[2]*coords[2] + self._dist_hor_2)
+        mask = r < max_distance
+        r = r[mask]
+        codes = list(compress(self._codes, mask))
+        in_range = dict(zip(codes, r.tolist()))
+        for code in self._distance_dict.keys() - in_range.keys():
+            del self._distance_dict[code]
+            del self._log10_distance_dict[code]
+        self._distance_dict.update(in_range)
+        self._log10_distance_dict.update(zip(codes, np.log10(r).tolist()))
+
+    def _eval_dist_hor_2(self, start=0):
+        """Squared horizontal distances (km^2) of the stations to the
+        epicenter, from the station with index `start` onwards."""
+        lon = self._ref_lon[start:self.n_sta]
+        lat = self._ref_lat[start:self.n_sta]
+        x = np.empty(lon.size, dtype=self._dtype)
+        y = np.empty(lon.size, dtype=self._dtype)
+        tm_forward(lon, lat, self._epicenter[0], self._epicenter[1], x, y)
+        return (x*x + y*y)*1.e-6
 
     def eval_ref_values(self, t_origin=None, window_ref=default_win_ref,
                         force_eval_ref_values=False, **kwargs_mean):
@@ -292,28 +360,46 @@ class NetworkTimeSeries:
                                force_eval_ref_values=force_eval_ref_values,
                                **kwargs_mean)
 
+    def _map_stations(self, method_name, codes, *args_per_station,
+                      **kwargs):
+        """Calls a method of the buffers of several stations.
+
+        :param method_name: name of the method of
+            :py:class:`gnss_timeseries.gnss_timeseries.GnssTimeSeries`
+        :param codes: station codes
+        :param args_per_station: iterables with positional arguments, one
+            element per station.
+        :param kwargs: key-worded arguments (the same for all stations)
+        :return: dictionary code -> result
+        """
+        if codes is self._codes:
+            # whole network: no need to look up the buffers
+            ts_list = self._station_ts
+        else:
+            ts_list = [self.station_timeseries(code) for code in codes]
+        return {code: getattr(ts, method_name)(*args, **kwargs)
+                for code, ts, *args in zip(codes, ts_list, *args_per_station)}
+
     def eval_pgd(self, t_s_dict=None,
                  window_pgd=default_win_pgd, only_hor=False,
                  window_ref=default_win_ref, force_eval_ref_values=False,
                  **kwargs_mean):
-        pgd_dict = dict()
         if t_s_dict is None:
             t_s_dict = dict()
-        for code in self._codes:
-            pgd_dict[code] = self.eval_pgd_at_station(
-                code, t_s=t_s_dict.get(code), window_pgd=window_pgd,
-                only_hor=only_hor, window_ref=window_ref,
-                force_eval_ref_values=force_eval_ref_values, **kwargs_mean)
-        return pgd_dict
+        return self._map_stations(
+            'eval_pgd', self._codes, repeat(self._t_origin),
+            [t_s_dict.get(code) for code in self._codes],
+            window_pgd=window_pgd, only_hor=only_hor,
+            window_ref=window_ref,
+            force_eval_ref_values=force_eval_ref_values, **kwargs_mean)
 
     def eval_offset(self, t_eval_dict, window_ref=default_win_ref,
                     force_eval_ref_values=False, **kwargs_mean):
-        offset_dict = dict()
-        for code in self._codes:
-            offset_dict[code] = self.eval_offset_at_station(
-                code, t_eval_dict.get(code), window_ref=window_ref,
-                force_eval_ref_values=force_eval_ref_values, **kwargs_mean)
-        return offset_dict
+        return self._map_stations(
+            'eval_offset', self._codes,
+            [t_eval_dict.get(code) for code in self._codes],
+            repeat(self._t_origin), window_ref=window_ref,
+            force_eval_ref_values=force_eval_ref_values, **kwargs_mean)
 
     def eval_pgd_at_station(self, code, t_s=None,
                             window_pgd=default_win_pgd,
@@ -338,88 +424,87 @@ class NetworkTimeSeries:
             {code: value['PGD'] for code, value in aux.items()})
 
     def mw_from_pgd(self, pgd_dict):
-        results_dict = dict()
-        for code, r in self._distance_dict.items():
-            try:
-                pgd = pgd_dict[code]
-                if isfinite(pgd):
-                    results_dict[code] = (mw_melgar(100*pgd, r), r)
-            except KeyError:
-                pass
-        return results_dict
+        codes = [code for code in self._distance_dict if code in pgd_dict]
+        pgd = np.fromiter((pgd_dict[code] for code in codes),
+                          dtype=float, count=len(codes))
+        log10_r = np.fromiter(
+            (self._log10_distance_dict[code] for code in codes),
+            dtype=float, count=len(codes))
+        mask = np.isfinite(pgd)
+        codes = list(compress(codes, mask))
+        mw = mw_melgar_precomp(100*pgd[mask], log10_r[mask])
+        return {code: (m, self._distance_dict[code])
+                for code, m in zip(codes, mw.tolist())}
 
     def mw_timeseries_from_pgd(self, vel_mask=3., sta_list=None, window=300,
                                max_distance=None, **kwargs_ref_value):
-        pgd_dict = self.pgd_timeseries(sta_list=sta_list,
-                                       window=window, **kwargs_ref_value)
+        pgd_dict = self.pgd_timeseries(sta_list=sta_list, window=window,
+                                       **kwargs_ref_value)
         # times at which each station is reached by the mask
 
         t_mask = []
         codes = []
         if max_distance is None:
             max_distance = default_max_distance
-        for code, r in self._distance_dict.items():
-            if r > max_distance or pgd_dict[code][0] is None:
+        for code, (pgd, t) in pgd_dict.items():
+            r = self._distance_dict.get(code)
+            if pgd is None or r is None or r > max_distance:
                 continue
             t_mask.append(self._t_origin + r/vel_mask)
             codes.append(code)
         if len(codes) == 0:
             return None, None
-        t_mask = np.array(t_mask)
         # minimum and maximum times
-        t_min = np.inf
-        t_max = -np.inf
-        for code in codes:
-            t = pgd_dict[code][1]
-            aux = t[0]
-            if aux < t_min:
-                t_min = aux
-            aux = t[-1]
-            if aux > t_max:
-                t_max = aux
+        t_ends = np.fromiter(
+            (x for code in codes
+             for x in (pgd_dict[code][1][0], pgd_dict[code][1][-1])),
+            dtype=float, count=2*len(codes)).reshape(-1, 2)
+        t_min = t_ends[:, 0].min()
+        t_max = t_ends[:, 1].max()
         t_step = 1./self.s_rate
         t_mw = np.arange(t_min-self._t_origin,
                          t_max-self._t_origin+0.5*t_step,
                          t_step)
-        mw = np.zeros(t_mw.size)
-        count = np.zeros(t_mw.size, dtype=int)
-
+        # indices in t_mw and values of the Mw time series of each station
+        index_list = [np.empty(0, dtype=np.intp)]
+        mw_list = [np.empty(0)]
         for code, t_m in zip(codes, t_mask):
             pgd, t = pgd_dict[code]
             if t_m > t[-1]:
                 continue
-            k = np.argmin(np.abs(t-t_m))
-            aux = mw_melgar(100*pgd[k:], self._distance_dict[code])
-            i1 = np.argmin(np.abs(t_mw - (t[k] - self._t_origin)))
-            i2 = i1 + aux.size
-            mw[i1:i2] += aux
-            count[i1:i2] += 1
+            k = _nearest_index(t, t_m)
+            aux = mw_melgar_fixed_r(
+                100*pgd[k:],
+                1./(1.047 - 0.138*self._log10_distance_dict[code]))
+            i1 = _nearest_index(t_mw, t[k] - self._t_origin)
+            index_list.append(np.arange(i1, i1 + aux.size))
+            mw_list.append(aux)
+        index = np.concatenate(index_list)
+        if index.size == 0:
+            # no station reached by the mask yet
+            return np.full(t_mw.size, np.nan), t_mw
+        mw = np.bincount(index, weights=np.concatenate(mw_list),
+                         minlength=t_mw.size)
+        count = np.bincount(index, minlength=t_mw.size)
         count[count == 0] = 1
         mw /= count
         mw[mw < 1.e-5] = np.nan
         return mw, t_mw
 
-    def pgd_timeseries(self, sta_list=None,
-                       window=300, **kwargs_ref_value):
+    def pgd_timeseries(self, sta_list=None, window=300, **kwargs_ref_value):
         if sta_list is None:
             sta_list = self.station_codes()
-        pgd_dict = dict()
-        for code in sta_list:
-            pgd_dict[code] = self.station_timeseries(
-                code).pgd_timeseries(self._t_origin, window=window,
-                                     **kwargs_ref_value)
-        return pgd_dict
-
-    def ground_displ_timeseries(self, sta_list=None,
-                                window=300, **kwargs_ref_value):
+        return self._map_stations(
+            'pgd_timeseries', sta_list, repeat(self._t_origin),
+            window=window, **kwargs_ref_value)
+
+    def ground_displ_timeseries(self, sta_list=None, window=300,
+                                **kwargs_ref_value):
         if sta_list is None:
             sta_list = self.station_codes()
-        ground_displ_dict = dict()
-        for code in sta_list:
-            ground_displ_dict[code] = self.station_timeseries(
-                code).ground_displ_timeseries(self._t_origin, window=window,
-                                              **kwargs_ref_value)
-        return ground_displ_dict
+        return self._map_stations(
+            'ground_displ_timeseries', sta_list, repeat(self._t_origin),
+            window=window, **kwargs_ref_value)
 
     def set_win_offset(self, win_offset):
         win = parse_time(win_offset)
@@ -427,6 +512,25 @@ class NetworkTimeSeries:
             ts.win_offset = win
 
 
+def _nearest_index(t, value):
+    """Index of the element of an increasing array nearest to a value
+    (the first one in case of a tie, like ``np.argmin(np.abs(t-value))``),
+    found by bisection.
+
+    .. warning::
+        The array is not checked: the result is meaningless if it is not
+        strictly increasing (e.g., the times of a buffer or ``np.arange``).
+
+    :param t: strictly increasing array
+    :param value: value
+    :return: index
+    """
+    k = np.searchsorted(t, value)
+    if k == t.size or (k > 0 and value - t[k-1] <= t[k] - value):
+        k -= 1
+    return k
+
+
 def mw_crowel(pgd, r_hypo):
     r"""Computes an estimate of the moment magnitude of an earthquake as a
     given the peak ground displacement (PGD) and the hypocentral distance,
@@ -474,3 +578,40 @@ def mw_melgar(pgd, r_hypo):
     :return: estimate of the moment magnitude :math:`M_W`
     """
     return (np.log10(pgd) + 4.434)/(1.047 - 0.138*np.log10(r_hypo))
+
+
+def mw_melgar_precomp(pgd, log10_r):
+    r"""Same as :py:func:`mw_melgar`, but takes the (precomputed) base 10
+    logarithm of the hypocentral distance.
+
+    :param pgd: peak ground displacement :math:`\text{PGD}` in cm
+    :param log10_r: :math:`\log(R)`, with :math:`R` the distance to
+        hypocenter in km.
+    :return: estimate of the moment magnitude :math:`M_W`
+    """
+    return (np.log10(pgd) + 4.434)/(1.047 - 0.138*log10_r)
+
+
+def mw_melgar_fixed_r(pgd, inv_denom):
+    r"""Same as :py:func:`mw_melgar`, for a PGD time series at a station,
+    i.e., at a fixed hypocentral distance. Compiled with numba when it is
+    available.
+
+    :param pgd: peak ground displacements :math:`\text{PGD}` in cm (array)
+    :param inv_denom: :math:`1/(1.047 - 0.138\,\log(R))`, with :math:`R` the
+        distance to hypocenter in km.
+    :return: estimates of the moment magnitude :math:`M_W`
+    """
+    if has_numba:
+        return _mw_melgar_fixed_r_jit(pgd, inv_denom)
+    return (np.log10(pgd) + 4.434)*inv_denom
+
+
+if has_numba:
+    # no fastmath: PGD can be zero, and log10(0) = -inf must be kept
+    @njit(cache=True)
+    def _mw_melgar_fixed_r_jit(pgd, inv_denom):
+        out = np.empty_like(pgd)
+        for i in range(pgd.size):
+            out[i] = (math.log10(pgd[i]) + 4.434)*inv_denom
+        return out
@@ -0,0 +1,108 @@
+import math
+import numpy as np
+try:
+    from numba import njit, prange
+    has_numba = True
+except ImportError:
+    njit = prange = None
+    has_numba = False
+
+# WGS84 ellipsoid
+_a = 6378137.
+_f = 1./298.257223563
+# third flattening
+_n = _f/(2 - _f)
+# first eccentricity
+_e = 2*math.sqrt(_n)/(1 + _n)
+# radius of the rectifying sphere
+_A = _a/(1 + _n)*(1 + _n**2/4 + _n**4/64 + _n**6/256)
+# coefficients of the Krüger series (6th order in n)
+_alpha = np.array((
+    _n/2 - 2*_n**2/3 + 5*_n**3/16 + 41*_n**4/180 - 127*_n**5/288 +
+    7891*_n**6/37800,
+    13*_n**2/48 - 3*_n**3/5 + 557*_n**4/1440 + 281*_n**5/630 -
+    1983433*_n**6/1935360,
+    61*_n**3/240 - 103*_n**4/140 + 15061*_n**5/26880 +
+    167603*_n**6/181440,
+    49561*_n**4/161280 - 179*_n**5/168 + 6601661*_n**6/7257600,
+    34729*_n**5/80640 - 3418889*_n**6/1995840,
+    212378941*_n**6/319334400))
+
+
+def _tm_forward_point(lon, lat, lon0, alpha):
+    """Transverse Mercator projection (scale factor 1) of one point, with
+    the northing measured from the equator.
+
+    :param lon: longitude in degrees
+    :param lat: latitude in degrees
+    :param lon0: central meridian in degrees
+    :param alpha: coefficients of the Krüger series
+    :return: easting, northing in meters
+    """
+    phi = math.radians(lat)
+    lam = math.radians(lon - lon0)
+    sin_phi = math.sin(phi)
+    tau = math.sinh(math.atanh(sin_phi) - _e*math.atanh(_e*sin_phi))
+    cos_lam = math.cos(lam)
+    xi_p = math.atan2(tau, cos_lam)
+    eta_p = math.atanh(math.sin(lam)/math.sqrt(1 + tau*tau))
+    xi = xi_p
+    eta = eta_p
+    for j in range(alpha.size):
+        k = 2*(j + 1)
+        xi += alpha[j]*math.sin(k*xi_p)*math.cosh(k*eta_p)
+        eta += alpha[j]*math.cos(k*xi_p)*math.sinh(k*eta_p)
+    return _A*eta, _A*xi
+
+
+def _tm_forward_numpy(lon, lat, lon0, lat0, out_x, out_y):
+    # same as _tm_forward_point, on arrays (computed in float64)
+    phi = np.radians(np.asarray(lat, dtype=float))
+    lam = np.radians(np.asarray(lon, dtype=float) - lon0)
+    sin_phi = np.sin(phi)
+    tau = np.sinh(np.arctanh(sin_phi) - _e*np.arctanh(_e*sin_phi))
+    xi_p = np.arctan2(tau, np.cos(lam))
+    eta_p = np.arctanh(np.sin(lam)/np.sqrt(1 + tau*tau))
+    xi = xi_p.copy()
+    eta = eta_p.copy()
+    for j in range(_alpha.size):
+        k = 2*(j + 1)
+        xi += _alpha[j]*np.sin(k*xi_p)*np.cosh(k*eta_p)
+        eta += _alpha[j]*np.cos(k*xi_p)*np.sinh(k*eta_p)
+    y0 = _tm_forward_point(lon0, lat0, lon0, _alpha)[1]
+    out_x[:] = _A*eta
+    out_y[:] = _A*xi - y0
+
+
+def tm_forward(lon, lat, lon0, lat0, out_x, out_y):
+    """Transverse Mercator projection of a set of points, centered at
+    (lon0, lat0). Compiled with numba when it is available, computed with
+    NumPy otherwise.
+
+    :param lon: longitudes in degrees (1D array)
+    :param lat: latitudes in degrees (1D array)
+    :param lon0: longitude of the origin in degrees
+    :param lat0: latitude of the origin in degrees
+    :param out_x: output array for the eastings in meters
+    :param out_y: output array for the northings in meters
+    """
+    if has_numba:
+        _tm_forward_jit(lon, lat, float(lon0), float(lat0),
+                        out_x, out_y, _alpha)
+    else:
+        _tm_forward_numpy(lon, lat, lon0, lat0, out_x, out_y)
+
+
+if has_numba:
+    _tm_forward_point = njit(cache=True, fastmath=True)(_tm_forward_point)
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _tm_forward_jit(lon, lat, lon0, lat0, out_x, out_y, alpha):
+        y0 = _tm_forward_point(lon0, lat0, lon0, alpha)[1]
+        for k in prange(lon.size):
+            # computed in float64 whatever the type of the arrays (in numba,
+            # float() keeps float32 values as float32)
+            x, y = _tm_forward_point(np.float64(lon[k]), np.float64(lat[k]),
+                                     lon0, alpha)
+            out_x[k] = x
+            out_y[k] = y - y0
@@ -24,8 +24,9 @@ setup(
     python_requires='>=3.5, !=3.7.*',
     install_requires=['numpy',
                       'matplotlib',
-                      'scipy',
-                      'geoproj'],
+                      'scipy'],
+    # optional: compiled kernels for network-wide computations
+    extras_require={'numba': ['numba']},
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
     # packages=find_packages(exclude=['contrib', 'docs', 'examples']),
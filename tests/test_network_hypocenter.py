@@ -0,0 +1,44 @@
+import numpy as np
+from gnss_timeseries.network import NetworkTimeSeries
+
+rng = np.random.default_rng(0)
+stations = [('S{:03d}'.format(k),
+             (rng.uniform(-74., -69.), rng.uniform(-34., -26.)))
+            for k in range(40)]
+max_distance = 400.
+
+
+def check_distances(network, hypocenter):
+    # distances computed from scratch by a new network
+    net_ref = NetworkTimeSeries()
+    for code, ref_coords in stations[:network.n_sta]:
+        net_ref.add_station(code, ref_coords=ref_coords)
+    net_ref.set_hypocenter_coords(hypocenter, max_distance=max_distance)
+    r_dict = network.dist_to_hypocenter()
+    r_ref = net_ref.dist_to_hypocenter()
+    print(len(r_dict), len(r_ref))
+    assert r_dict.keys() == r_ref.keys()
+    for code, r in r_ref.items():
+        assert abs(r_dict[code] - r) <= 1.e-6*r
+
+
+net = NetworkTimeSeries()
+for code, ref_coords in stations[:30]:
+    net.add_station(code, ref_coords=ref_coords)
+# TEST:  first hypocenter (no previous one)  -->  check
+net.set_hypocenter_coords((-71.5, -30., 30.), max_distance=max_distance)
+check_distances(net, (-71.5, -30., 30.))
+# TEST:  only the depth changes  -->  check (no new projection)
+dist_hor_2 = net._dist_hor_2
+net.set_hypocenter_coords((-71.5, -30., 80.), max_distance=max_distance)
+assert net._dist_hor_2 is dist_hor_2
+check_distances(net, (-71.5, -30., 80.))
+# TEST:  stations added after the hypocenter  -->  check
+for code, ref_coords in stations[30:]:
+    net.add_station(code, ref_coords=ref_coords)
+net.set_hypocenter_coords((-71.5, -30., 20.), max_distance=max_distance)
+assert net._dist_hor_2.size == len(stations)
+check_distances(net, (-71.5, -30., 20.))
+# TEST:  new epicenter  -->  check
+net.set_hypocenter_coords((-72.3, -31.2, 20.), max_distance=max_distance)
+check_distances(net, (-72.3, -31.2, 20.))
@@ -0,0 +1,23 @@
+import numpy as np
+from gnss_timeseries.network import NetworkTimeSeries
+
+t_origin = 1.e6
+n_ref = 700
+# data up to 10 s after the origin time
+t = t_origin + np.arange(-n_ref + 1, 11, dtype=float)
+enu = [np.random.normal(0, 0.01, t.size) for _ in range(3)]
+std_enu = [np.full(t.size, 0.01) for _ in range(3)]
+
+net = NetworkTimeSeries(length='1h', sampling_rate='1/s')
+for code, ref_coords in (('AAAA', (-71.0, -30.0)), ('BBBB', (-70.5, -30.5))):
+    net.add_station(code, ref_coords=ref_coords)
+    net.set_station_timeseries(code, enu, std_enu, t)
+net.set_hypocenter_coords((-71.5, -30.0, 30.0))
+net.set_t_origin(t_origin)
+
+# TEST:  stations not yet reached by the mask  -->  no Mw estimates
+mw, t_mw = net.mw_timeseries_from_pgd(vel_mask=3.)
+print(mw, t_mw)
+assert mw.dtype == float
+assert mw.size == t_mw.size
+assert np.all(np.isnan(mw))
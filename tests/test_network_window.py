@@ -0,0 +1,43 @@
+import copy
+import pickle
+import numpy as np
+from gnss_timeseries.network import NetworkTimeSeries
+
+t0 = 1.e6
+net = NetworkTimeSeries(length='1h', sampling_rate='1/s')
+for code, ref_coords in (('AAAA', (-71.0, -30.0)), ('BBBB', (-70.5, -30.5))):
+    net.add_station(code, ref_coords=ref_coords)
+    for k in range(100):
+        net.add_point_to_station(code, (0., 0., 0.), (0.01, 0.01, 0.01),
+                                 t0 + k)
+
+
+def check_window(network):
+    # window computed from the buffers (cleared buffers are ignored)
+    t_first = np.nanmin([network.station_timeseries(c).t_first
+                         for c in network.station_codes()])
+    t_last = np.nanmax([network.station_timeseries(c).t_last
+                        for c in network.station_codes()])
+    t_min, t_oldest, t_max = network.available_window()
+    print(t_min, t_max, t_first, t_last)
+    assert t_min == t_first
+    assert t_max == t_last
+
+
+# TEST:  window after adding points  -->  check
+check_window(net)
+net.add_point_to_station('BBBB', (0., 0., 0.), (0.01, 0.01, 0.01), t0 + 200)
+check_window(net)
+# TEST:  window after modifying a buffer directly  -->  check
+net.station_timeseries('BBBB').clear()
+check_window(net)
+# TEST:  window of copies of the network  -->  check
+for net_copy in (copy.deepcopy(net), pickle.loads(pickle.dumps(net))):
+    net_copy.add_point_to_station('BBBB', (0., 0., 0.), (0.01, 0.01, 0.01),
+                                  t0 + 300)
+    check_window(net_copy)
+    net_copy.station_timeseries('AAAA').clear()
+    check_window(net_copy)
+# the original network is not modified by its copies
+check_window(net)
+assert net.station_timeseries('BBBB').cleared
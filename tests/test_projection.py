@@ -0,0 +1,45 @@
+import numpy as np
+from gnss_timeseries.projection import tm_forward, _tm_forward_numpy
+
+lon0, lat0 = -71.5, -30.
+lon = np.array((-71.5, -70., -75., -68.2, -80.))
+lat = np.array((-30., -33.45, -20., -41.1, -10.))
+# Transverse Mercator (WGS84, scale factor 1) centered at (lon0, lat0),
+# computed with PROJ
+x_ref = np.array((0., 139470.1973, -366440.5849, 277247.1217, -935184.6236))
+y_ref = np.array((0., -383549.9161, 1103915.8145, -1236817.0821,
+                  2202146.3874))
+
+x = np.empty(lon.size)
+y = np.empty(lon.size)
+# TEST:  projection (numba if available)  -->  check
+tm_forward(lon, lat, lon0, lat0, x, y)
+print(np.abs(x - x_ref).max(), np.abs(y - y_ref).max())
+assert np.abs(x - x_ref).max() < 1.e-3
+assert np.abs(y - y_ref).max() < 1.e-3
+# TEST:  NumPy projection  -->  check
+_tm_forward_numpy(lon, lat, lon0, lat0, x, y)
+print(np.abs(x - x_ref).max(), np.abs(y - y_ref).max())
+assert np.abs(x - x_ref).max() < 1.e-3
+assert np.abs(y - y_ref).max() < 1.e-3
+# float32 coordinates: the projection must still be computed in float64
+lon_32 = lon.astype(np.float32)
+lat_32 = lat.astype(np.float32)
+x_64 = np.empty(lon.size)
+y_64 = np.empty(lon.size)
+tm_forward(lon_32.astype(float), lat_32.astype(float), lon0, lat0, x_64, y_64)
+for func in (tm_forward, _tm_forward_numpy):
+    # TEST:  float32 input, float64 output  -->  check
+    func(lon_32, lat_32, lon0, lat0, x, y)
+    print(np.abs(x - x_64).max(), np.abs(y - y_64).max())
+    assert np.abs(x - x_64).max() < 1.e-6
+    assert np.abs(y - y_64).max() < 1.e-6
+    # TEST:  float32 input and output  -->  check (rounding of the output)
+    x_32 = np.empty(lon.size, dtype=np.float32)
+    y_32 = np.empty(lon.size, dtype=np.float32)
+    func(lon_32, lat_32, lon0, lat0, x_32, y_32)
+    print(np.abs(x_32 - x_64).max(), np.abs(y_32 - y_64).max())
+    assert np.abs(x_32 - x_64).max() < 0.25
+    assert np.abs(y_32 - y_64).max() < 0.25
+    # the point at the origin is projected to (0, 0)
+    assert abs(x_32[0]) < 1.e-6 and abs(y_32[0]) < 1.e-6